@@ -11,8 +11,10 @@ from . import catalogue, config, processing, profile
 class ApiClient:
     key: Optional[str] = None
     url: Optional[str] = None
-    session: requests.Session = attrs.field(factory=requests.Session)
+    session: requests.Session = attrs.field(factory=processing.make_session)
     sleep_max: int = 120
+    sleep_min: float = 0.05
+    long_poll: bool = False
 
     def get_url(self) -> str:
         return self.url or config.get_config("url")
@@ -39,11 +41,15 @@ class ApiClient:
             headers=self._headers(),
             session=self.session,
             sleep_max=self.sleep_max,
+            sleep_min=self.sleep_min,
+            long_poll=self.long_poll,
         )
 
     @functools.cached_property
     def profile_api(self) -> profile.Profile:
-        return profile.Profile(f"{self.get_url()}/profiles", headers=self._headers())
+        return profile.Profile(
+            f"{self.get_url()}/profiles", headers=self._headers(), session=self.session
+        )
 
     def collections(self, **params: Dict[str, Any]) -> catalogue.Collections:
         return self.catalogue_api.collections(params=params)
@@ -61,7 +67,7 @@ class ApiClient:
         self,
         collection_id: str,
         target: Optional[str] = None,
-        retry_options: Dict[str, Any] = {},
+        retry_options: Optional[Dict[str, Any]] = None,
         **request: Any,
     ) -> str:
         collection = self.collection(collection_id)
@@ -72,7 +78,10 @@ class ApiClient:
         )
 
     def submit_and_wait_on_result(
-        self, collection_id: str, retry_options: Dict[str, Any] = {}, **request: Any
+        self,
+        collection_id: str,
+        retry_options: Optional[Dict[str, Any]] = None,
+        **request: Any,
     ) -> processing.Results:
         return self.retrieve_api.submit_and_wait_on_result(
             collection_id, retry_options=retry_options, **request
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+from typing import Any, Dict, Iterator, List, Optional
+
+import aiohttp
+import orjson
+
+from . import processing
+
+logger = processing.logger
+
+
+def _retry_delays(retry_options: Dict[str, Any]) -> Iterator[float]:
+    # same options and defaults as multiurl.robust on the synchronous path
+    maximum_tries = retry_options.get("maximum_tries", 500)
+    retry_after = retry_options.get("retry_after", 120)
+    if isinstance(retry_after, (list, tuple)):
+        delay, delay_max, ratio = retry_after
+    else:
+        delay = delay_max = retry_after
+        ratio = 1
+    for _ in range(maximum_tries - 1):
+        yield delay
+        delay = min(delay * ratio, delay_max)
+
+
+class AsyncRemote:
+    def __init__(
+        self, remote: processing.Remote, session: aiohttp.ClientSession
+    ) -> None:
+        self.remote = remote
+        self.session = session
+
+    async def _get_status(self, retry_options: Optional[Dict[str, Any]] = None) -> str:
+        remote = self.remote
+        params = {"log": "True"}
+        if remote.log_start_time:
+            params["logStartTime"] = remote.log_start_time
+
+        delays = _retry_delays({} if retry_options is None else retry_options)
+        while True:
+            delay = next(delays, None)
+            logger.debug(f"GET {remote.url}")
+            try:
+                async with self.session.get(
+                    remote.url, headers=remote.headers, params=params
+                ) as response:
+                    content = await response.read()
+                    logger.debug(f"REPLY {content.decode()}")
+                    if (
+                        delay is None
+                        or response.status not in processing.RETRY_STATUS_CODES
+                    ):
+                        response.raise_for_status()
+                        break
+                    error = f"HTTP error [{response.status} {response.reason}]"
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as exc:
+                if delay is None:
+                    raise
+                error = f"connection error [{exc!r}]"
+            logger.warning(f"Recovering from {error}, retrying in {delay} seconds")
+            await asyncio.sleep(delay)
+
+        json: Dict[str, Any] = orjson.loads(content)
+        # share the last status with the synchronous remote
+        remote._set_status(json)
+        return str(json["status"])
+
+    async def wait_on_result(
+        self, retry_options: Optional[Dict[str, Any]] = None
+    ) -> None:
+        remote = self.remote
+        sleep = remote.sleep_min
+        status: Optional[str] = None
+        while True:
+            last_status, status = status, await self._get_status(retry_options)
+            next_sleep = remote._wait_step(sleep, last_status, status)
+            if next_sleep is None:
+                break
+            sleep = next_sleep
+            await asyncio.sleep(remote._jittered_sleep(sleep))
+        if status == "failed":
+            results = await asyncio.get_running_loop().run_in_executor(
+                None, remote._robust_results, retry_options
+            )
+            raise processing.ProcessingFailedError(
+                processing.error_json_to_message(results.json)
+            )
+
+    async def download(
+        self,
+        target: Optional[str] = None,
+        retry_options: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        await self.wait_on_result(retry_options=retry_options)
+        # downloads stay on the multiurl code path
+        return await asyncio.get_running_loop().run_in_executor(
+            None,
+            functools.partial(
+                self.remote._download_result, target, retry_options=retry_options
+            ),
+        )
+
+
+async def wait_on_results(
+    remotes: List[processing.Remote],
+    workers: int = 100,
+    conns_per_host: int = 4,
+    retry_options: Optional[Dict[str, Any]] = None,
+) -> None:
+    connector = aiohttp.TCPConnector(limit=workers, limit_per_host=conns_per_host)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        # one failing job doesn't abort waiting on the others
+        outcomes = await asyncio.gather(
+            *(
+                AsyncRemote(remote, session).wait_on_result(retry_options)
+                for remote in remotes
+            ),
+            return_exceptions=True,
+        )
+    errors = []
+    for remote, outcome in zip(remotes, outcomes):
+        if isinstance(outcome, BaseException):
+            logger.error(f"waiting on {remote.request_uid} failed: {outcome!r}")
+            errors.append(outcome)
+    if errors:
+        raise errors[0]
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import concurrent.futures
 import datetime
+import functools
 from typing import Any, Dict, List, Optional
 
 try:
@@ -28,8 +30,6 @@ class Collections(processing.ApiResponse):
 
 @attrs.define
 class Collection(processing.ApiResponse):
-    headers: Dict[str, Any] = {}
-
     def end_datetime(self) -> datetime.datetime:
         try:
             end = self.json["extent"]["temporal"]["interval"][1]
@@ -43,21 +43,26 @@ class Collection(processing.ApiResponse):
         assert isinstance(collection_id, str)
         return collection_id
 
-    def retrieve_process(self) -> processing.Process:
+    @functools.cached_property
+    def _retrieve_process(self) -> processing.Process:
         url = self.get_link_href(rel="retrieve")
         return processing.Process.from_request(
             "get", url, headers=self.headers, session=self.session
         )
 
+    def retrieve_process(self) -> processing.Process:
+        # the process description lives as long as the (memoized) collection
+        return self._retrieve_process
+
     def submit(self, **request: Any) -> processing.Remote:
         retrieve_process = self.retrieve_process()
-        status_info = retrieve_process.execute(inputs=request, session=self.session)
+        status_info = retrieve_process.execute(inputs=request)
         return status_info.make_remote()
 
     def retrieve(
         self,
         target: Optional[str] = None,
-        retry_options: Dict[str, Any] = {},
+        retry_options: Optional[Dict[str, Any]] = None,
         **request: Any,
     ) -> str:
         remote = self.submit(**request)
@@ -71,24 +76,41 @@ class Catalogue:
         self,
         url: str,
         force_exact_url: bool = False,
-        headers: Dict[str, Any] = {},
-        session: requests.Session = requests.api,  # type: ignore
+        headers: Optional[Dict[str, Any]] = None,
+        session: Optional[requests.Session] = None,
     ) -> None:
         if not force_exact_url:
             url = f"{url}/{self.supported_api_version}"
         self.url = url
-        self.headers = headers
-        self.session = session
+        self.headers = {} if headers is None else headers
+        self.session = processing.default_session() if session is None else session
+        self._collections: Dict[str, Collection] = {}
 
-    def collections(self, params: Dict[str, Any] = {}) -> Collections:
+    def collections(self, params: Optional[Dict[str, Any]] = None) -> Collections:
         url = f"{self.url}/datasets"
         return Collections.from_request("get", url, params=params, session=self.session)
 
     def collection(self, collection_id: str) -> Collection:
-        url = f"{self.url}/collections/{collection_id}"
-        return Collection.from_request(
-            "get", url, headers=self.headers, session=self.session
-        )
+        # collection metadata doesn't change during the life of a client
+        if (collection := self._collections.get(collection_id)) is None:
+            url = f"{self.url}/collections/{collection_id}"
+            collection = Collection.from_request(
+                "get", url, headers=self.headers, session=self.session
+            )
+            self._collections[collection_id] = collection
+        return collection
+
+    def invalidate(self, collection_id: Optional[str] = None) -> None:
+        if collection_id is None:
+            self._collections.clear()
+        else:
+            self._collections.pop(collection_id, None)
+
+    def collections_bulk(
+        self, collection_ids: List[str], workers: int = 8
+    ) -> List[Collection]:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(self.collection, collection_ids))
 
     def licenses(self) -> Dict[str, Any]:
         url = f"{self.url}/vocabularies/licences"
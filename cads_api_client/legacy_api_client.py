@@ -7,7 +7,6 @@ from types import TracebackType
 from typing import Any, Callable, TypeVar, cast, overload
 
 import cdsapi.api
-import requests
 
 from . import api_client, processing
 
@@ -78,7 +77,8 @@ class LegacyApiClient(cdsapi.api.Client):  # type: ignore[misc]
         kwargs.update(zip(LEGACY_KWARGS, args))
 
         self.url, self.key, _ = cdsapi.api.get_url_key_verify(url, key, None)
-        self.session = kwargs.pop("session", requests.Session())
+        session = kwargs.pop("session", None)
+        self.session = processing.make_session() if session is None else session
         self.sleep_max = kwargs.pop("sleep_max", 120)
         self.client = api_client.ApiClient(
             url=self.url,
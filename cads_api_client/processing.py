@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import concurrent.futures
 import functools
 import logging
 import os
+import random
+import threading
 import time
 import urllib.parse
-from typing import Any, Dict, List, Optional, Type, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 try:
     from typing import Self
@@ -14,12 +17,19 @@ except ImportError:
 
 import attrs
 import multiurl
+import orjson
 import requests
 
 T_ApiResponse = TypeVar("T_ApiResponse", bound="ApiResponse")
 
 logger = logging.getLogger(__name__)
 
+POOL_MAXSIZE = 10
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+DEFAULT_RETRY_OPTIONS = {"maximum_tries": 2, "retry_after": 10}
+RANGE_CHUNK_SIZE = 16 * 1024 * 1024
+RANGE_WORKERS = 4
+
 
 class ProcessingFailedError(RuntimeError):
     pass
@@ -55,26 +65,133 @@ def cads_raise_for_status(response: requests.Response) -> None:
             response.raise_for_status()
 
 
+_default_session: Optional[requests.Session] = None
+_default_session_lock = threading.Lock()
+
+
+def make_session() -> requests.Session:
+    # a pooled session keeps connections alive across catalogue, processing
+    # and status polling calls
+    session = requests.Session()
+    # retrying in the adapter keeps the pooled connections alive
+    retry = requests.adapters.Retry(
+        total=5,
+        backoff_factor=0.3,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=frozenset(["GET", "POST"]),
+        raise_on_status=False,
+    )
+    for prefix in ("http://", "https://"):
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=POOL_MAXSIZE,
+            pool_maxsize=POOL_MAXSIZE,
+            max_retries=retry,
+        )
+        session.mount(prefix, adapter)
+    return session
+
+
+def has_retries(session: requests.Session) -> bool:
+    for adapter in session.adapters.values():
+        if isinstance(adapter, requests.adapters.HTTPAdapter):
+            if adapter.max_retries.total != 0:
+                return True
+    return False
+
+
+def with_retries(
+    call: Callable[..., Any], session: requests.Session, **retry_options: Any
+) -> Callable[..., Any]:
+    # sessions retrying in their adapters are not wrapped again, as the
+    # two layers of retries would multiply
+    if has_retries(session):
+        return call
+    robust_call: Callable[..., Any] = multiurl.robust(call, **retry_options)
+    return robust_call
+
+
+def resize_pool(session: requests.Session, maxsize: int) -> None:
+    for adapter in session.adapters.values():
+        if not isinstance(adapter, requests.adapters.HTTPAdapter):
+            continue
+        poolmanager = adapter.poolmanager
+        pool_kw = poolmanager.connection_pool_kw
+        if pool_kw.get("maxsize", 1) < maxsize:
+            adapter.init_poolmanager(
+                maxsize, maxsize, block=pool_kw.get("block", False)
+            )
+            poolmanager.clear()
+
+
+_inflight: Dict[Tuple[Any, ...], concurrent.futures.Future[requests.Response]] = {}
+_inflight_lock = threading.Lock()
+
+
+def coalesced_request(
+    request: Callable[..., requests.Response], key: Tuple[Any, ...]
+) -> requests.Response:
+    # concurrent identical requests wait for the first one instead of
+    # reaching the server again
+    with _inflight_lock:
+        future = _inflight.get(key)
+        owner = future is None
+        if future is None:
+            future = _inflight[key] = concurrent.futures.Future()
+    if not owner:
+        return future.result()
+
+    try:
+        response = request()
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(response)
+        return response
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def default_session() -> requests.Session:
+    global _default_session
+    with _default_session_lock:
+        if _default_session is None:
+            _default_session = make_session()
+    return _default_session
+
+
 @attrs.define(slots=False)
 class ApiResponse:
     response: requests.Response
-    headers: Dict[str, Any] = {}
-    session: requests.Session = (requests.api,)  # type: ignore
+    headers: Dict[str, Any] = attrs.field(factory=dict)
+    session: requests.Session = attrs.field(factory=default_session)
 
     @classmethod
     def from_request(
         cls: Type[T_ApiResponse],
         *args: Any,
         raise_for_status: bool = True,
-        session: requests.Session = requests.api,  # type: ignore
-        retry_options: Dict[str, Any] = {"maximum_tries": 2, "retry_after": 10},
+        session: Optional[requests.Session] = None,
+        retry_options: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> T_ApiResponse:
         method = kwargs["method"] if "method" in kwargs else args[0]
         url = kwargs["url"] if "url" in kwargs else args[1]
         inputs = kwargs.get("json", {}).get("inputs", {})
         logger.debug(f"{method.upper()} {url} {inputs}")
-        response = multiurl.robust(session.request, **retry_options)(*args, **kwargs)
+        if session is None:
+            session = default_session()
+        if retry_options is None:
+            retry_options = DEFAULT_RETRY_OPTIONS
+        request = functools.partial(
+            with_retries(session.request, session, **retry_options), *args, **kwargs
+        )
+        if method.upper() == "GET" and not kwargs.get("stream"):
+            key = (id(session), repr(args), repr(sorted(kwargs.items())))
+            response = coalesced_request(request, key)
+        else:
+            response = request()
         logger.debug(f"REPLY {response.text}")
 
         if raise_for_status:
@@ -85,7 +202,7 @@ class ApiResponse:
 
     @functools.cached_property
     def json(self) -> Dict[str, Any]:
-        return self.response.json()  # type: ignore
+        return orjson.loads(self.response.content)  # type: ignore
 
     def log_messages(self) -> None:
         messages = (
@@ -100,12 +217,17 @@ class ApiResponse:
             level = logging.getLevelName(severity)
             logger.log(level if isinstance(level, int) else 20, content)
 
-    def get_links(self, rel: Optional[str] = None) -> List[Dict[str, str]]:
-        links = []
+    @functools.cached_property
+    def _links_by_rel(self) -> Dict[Optional[str], List[Dict[str, str]]]:
+        links_by_rel: Dict[Optional[str], List[Dict[str, str]]] = {}
         for link in self.json.get("links", []):
-            if rel is not None and link.get("rel") == rel:
-                links.append(link)
-        return links
+            links_by_rel.setdefault(link.get("rel"), []).append(link)
+        return links_by_rel
+
+    def get_links(self, rel: Optional[str] = None) -> List[Dict[str, str]]:
+        if rel is not None:
+            return self._links_by_rel.get(rel, [])
+        return [link for links in self._links_by_rel.values() for link in links]
 
     def get_link_href(self, **kwargs: str) -> str:
         links = self.get_links(**kwargs)
@@ -139,8 +261,6 @@ class ProcessList(ApiResponse):
 
 @attrs.define
 class Process(ApiResponse):
-    headers: Dict[str, Any] = {}
-
     @property
     def id(self) -> str:
         process_id = self.json["id"]
@@ -150,10 +270,11 @@ class Process(ApiResponse):
     def execute(
         self,
         inputs: Dict[str, Any],
-        retry_options: Dict[str, Any] = {},
+        retry_options: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> StatusInfo:
         assert "json" not in kwargs
+        kwargs.setdefault("session", self.session)
         url = f"{self.response.request.url}/execute"
         json = {"inputs": inputs}
         return StatusInfo.from_request(
@@ -161,13 +282,18 @@ class Process(ApiResponse):
             url,
             json=json,
             headers=self.headers,
-            retry_options=retry_options,
+            retry_options={} if retry_options is None else retry_options,
             **kwargs,
         )
 
-    def valid_values(self, request: Dict[str, Any] = {}) -> Dict[str, Any]:
+    def valid_values(self, request: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         url = f"{self.response.request.url}/constraints"
-        response = ApiResponse.from_request("post", url, json={"inputs": request})
+        response = ApiResponse.from_request(
+            "post",
+            url,
+            json={"inputs": {} if request is None else request},
+            session=self.session,
+        )
         response.response.raise_for_status()
         return response.json
 
@@ -177,14 +303,23 @@ class Remote:
         self,
         url: str,
         sleep_max: int = 120,
-        headers: Dict[str, Any] = {},
-        session: requests.Session = requests.api,  # type: ignore
+        headers: Optional[Dict[str, Any]] = None,
+        session: Optional[requests.Session] = None,
+        sleep_min: float = 0.05,
+        long_poll: bool = False,
     ):
         self.url = url
         self.sleep_max = sleep_max
-        self.headers = headers
-        self.session = session
+        self.sleep_min = sleep_min
+        self.long_poll = long_poll
+        self.headers = {} if headers is None else headers
+        self.session = default_session() if session is None else session
         self.log_start_time = None
+        self.status_ttl = 1.0
+        self._status_cache: Tuple[Dict[str, Any], float] = ({}, float("-inf"))
+        self._status_response: Optional[ApiResponse] = None
+        self._conditional_headers: Dict[str, str] = {}
+        self._results: Optional[Results] = None
         logger.info(f"Request ID is {self.request_uid}")
 
     def log_metadata(self, metadata: dict[str, Any]) -> None:
@@ -202,50 +337,148 @@ class Remote:
     def request_uid(self) -> str:
         return self.url.rpartition("/")[2]
 
-    def _get_status(self, robust: bool, **retry_options: Any) -> str:
-        # TODO: cache responses for a timeout (possibly reported nby the server)
+    def _get_status_json(self, robust: bool, **retry_options: Any) -> Dict[str, Any]:
+        cached_json, fetched_at = self._status_cache
+        if cached_json.get("status") in ("successful", "failed"):
+            # final states never change
+            return cached_json
+        if time.monotonic() < fetched_at + self.status_ttl:
+            return cached_json
+
         get = self.session.get
         if robust:
-            get = multiurl.robust(get, **retry_options)
+            get = with_retries(get, self.session, **retry_options)
 
         params = {"log": True}
         if self.log_start_time:
             params["logStartTime"] = self.log_start_time
 
         logger.debug(f"GET {self.url}")
-        requests_response = get(url=self.url, headers=self.headers, params=params)
+        requests_response = get(
+            url=self.url,
+            headers={**self.headers, **self._conditional_headers},
+            params=params,
+        )
         logger.debug(f"REPLY {requests_response.text}")
         requests_response.raise_for_status()
-        json = requests_response.json()
+        json: Dict[str, Any]
+        if requests_response.status_code == 304:
+            json = cached_json
+            self._status_cache = (json, time.monotonic())
+        else:
+            self._status_response = ApiResponse(
+                requests_response, headers=self.headers, session=self.session
+            )
+            json = self._status_response.json
+            validators = {
+                "If-None-Match": requests_response.headers.get("ETag"),
+                "If-Modified-Since": requests_response.headers.get("Last-Modified"),
+            }
+            self._conditional_headers = {
+                header: value for header, value in validators.items() if value
+            }
+            self._set_status(json)
+        return json
+
+    def _set_status(self, json: Dict[str, Any]) -> None:
         self.log_metadata(json.get("metadata", {}))
-        return str(json["status"])
+        self._status_cache = (json, time.monotonic())
+
+    def _get_status(self, robust: bool, **retry_options: Any) -> str:
+        return str(self._get_status_json(robust, **retry_options)["status"])
 
     @property
     def status(self) -> str:
         return self._get_status(robust=False)
 
-    def _robust_status(self, retry_options: Dict[str, Any] = {}) -> str:
-        return self._get_status(robust=True, **retry_options)
-
-    def wait_on_result(self, retry_options: Dict[str, Any] = {}) -> None:
-        sleep = 1.0
-        status = None
+    def _robust_status(self, retry_options: Optional[Dict[str, Any]] = None) -> str:
+        return self._get_status(robust=True, **(retry_options or {}))
+
+    def _next_sleep(
+        self, sleep: float, last_status: Optional[str], status: str
+    ) -> float:
+        if (last_status, status) == ("accepted", "running"):
+            # poll tightly again around the start of the processing
+            return self.sleep_min
+        if last_status is None:
+            return sleep
+        return min(sleep * 1.5, self.sleep_max)
+
+    def _wait_step(
+        self, sleep: float, last_status: Optional[str], status: str
+    ) -> Optional[float]:
+        # shared by the sync and async waiting loops: returns the backoff
+        # before the next poll, or None once the job is done
+        if status != last_status:
+            logger.info(f"status has been updated to {status}")
+        if status in ("successful", "failed"):
+            return None
+        if status not in ("accepted", "running"):
+            raise ProcessingFailedError(f"Unknown API state {status!r}")
+        return self._next_sleep(sleep, last_status, status)
+
+    def _jittered_sleep(self, sleep: float) -> float:
+        jittered_sleep = sleep * random.uniform(0.8, 1.2)
+        logger.debug(f"result not ready, waiting for {jittered_sleep} seconds")
+        # expire the cached status before the next poll
+        self.status_ttl = min(jittered_sleep / 2, 1.0)
+        return jittered_sleep
+
+    def _watch_status(self) -> None:
+        # follow server-sent status events until the job is done, the
+        # stream ends or the server turns out not to support it
+        try:
+            response = self.session.get(
+                f"{self.url}/watch",
+                headers=self.headers,
+                stream=True,
+                timeout=(5, self.sleep_max),
+            )
+            with response:
+                content_type = response.headers.get("Content-Type", "")
+                if response.status_code != 200 or not content_type.startswith(
+                    "text/event-stream"
+                ):
+                    logger.debug(f"long polling not supported by {self.url}")
+                    self.long_poll = False
+                    return
+                event = None
+                data: List[str] = []
+                for line in response.iter_lines(decode_unicode=True):
+                    if line.startswith("event:"):
+                        event = line[len("event:") :].strip()
+                    elif line.startswith("data:"):
+                        data.append(line[len("data:") :])
+                    elif not line:
+                        # a blank line dispatches the event
+                        if event == "status" and data:
+                            json = orjson.loads("\n".join(data))
+                            status = json["status"]
+                            self._set_status(json)
+                            if status in ("successful", "failed"):
+                                return
+                        event, data = None, []
+        except requests.RequestException as exc:
+            logger.debug(f"long polling interrupted: {exc!r}")
+        except (ValueError, KeyError) as exc:
+            logger.debug(f"malformed status event, polling instead: {exc!r}")
+            self.long_poll = False
+
+    def wait_on_result(self, retry_options: Optional[Dict[str, Any]] = None) -> None:
+        if self.long_poll:
+            self._watch_status()
+        sleep = self.sleep_min
+        status: Optional[str] = None
         while True:
-            if status != (status := self._robust_status(retry_options=retry_options)):
-                logger.info(f"status has been updated to {status}")
-            if status == "successful":
+            last_status, status = status, self._robust_status(retry_options)
+            next_sleep = self._wait_step(sleep, last_status, status)
+            if next_sleep is None:
                 break
-            elif status == "failed":
-                results = multiurl.robust(self.make_results, **retry_options)(self.url)
-                raise ProcessingFailedError(error_json_to_message(results.json))
-            elif status in ("accepted", "running"):
-                sleep *= 1.5
-                if sleep > self.sleep_max:
-                    sleep = self.sleep_max
-            else:
-                raise ProcessingFailedError(f"Unknown API state {status!r}")
-            logger.debug(f"result not ready, waiting for {sleep} seconds")
-            time.sleep(sleep)
+            sleep = next_sleep
+            time.sleep(self._jittered_sleep(sleep))
+        if status == "failed":
+            results = self._robust_results(retry_options)
+            raise ProcessingFailedError(error_json_to_message(results.json))
 
     def build_status_info(self) -> StatusInfo:
         return StatusInfo.from_request(
@@ -255,15 +488,21 @@ class Remote:
     def make_results(self, url: Optional[str] = None) -> Results:
         if url is None:
             url = self.url
-        status = self.status
+        status_json = self._get_status_json(robust=False)
+        status = status_json["status"]
         if status not in ("successful", "failed"):
             raise ValueError(f"Result not ready, job is {status}")
 
-        logger.debug(f"GET {url}")
-        request_response = self.session.get(url, headers=self.headers)
-        logger.debug(f"REPLY {request_response.text}")
+        if url == self.url and self._results is not None:
+            return self._results
 
-        response = ApiResponse(request_response, session=self.session)
+        # the last polled status already carries the links
+        response = self._status_response
+        if url != self.url or response is None or response.json is not status_json:
+            logger.debug(f"GET {url}")
+            request_response = self.session.get(url, headers=self.headers)
+            logger.debug(f"REPLY {request_response.text}")
+            response = ApiResponse(request_response, session=self.session)
         try:
             results_url = response.get_link_href(rel="results")
         except RuntimeError:
@@ -275,16 +514,31 @@ class Remote:
             session=self.session,
             raise_for_status=False,
         )
+        if url == self.url and results.status_code == 200:
+            self._results = results
+        return results
+
+    def _robust_results(
+        self, retry_options: Optional[Dict[str, Any]] = None
+    ) -> Results:
+        make_results = with_retries(
+            self.make_results, self.session, **(retry_options or {})
+        )
+        results: Results = make_results(self.url)
         return results
 
     def _download_result(
-        self, target: Optional[str] = None, retry_options: Dict[str, Any] = {}
+        self,
+        target: Optional[str] = None,
+        retry_options: Optional[Dict[str, Any]] = None,
     ) -> str:
-        results: Results = multiurl.robust(self.make_results, **retry_options)(self.url)
+        results = self._robust_results(retry_options)
         return results.download(target, retry_options=retry_options)
 
     def download(
-        self, target: Optional[str] = None, retry_options: Dict[str, Any] = {}
+        self,
+        target: Optional[str] = None,
+        retry_options: Optional[Dict[str, Any]] = None,
     ) -> str:
         self.wait_on_result(retry_options=retry_options)
         return self._download_result(target, retry_options=retry_options)
@@ -324,45 +578,114 @@ class Results(ApiResponse):
     def reason(self) -> str:
         return self.response.reason
 
+    @functools.cached_property
+    def _asset_value(self) -> Dict[str, Any]:
+        asset_value: Dict[str, Any] = self.json.get("asset", {}).get("value", {})
+        return asset_value
+
     def get_result_href(self) -> str:
         if self.status_code != 200:
             raise KeyError("result_href not available for processing failed results")
-        href = self.json["asset"]["value"]["href"]
+        href = self._asset_value["href"]
         assert isinstance(href, str)
         return href
 
     def get_result_size(self) -> Optional[int]:
-        asset = self.json.get("asset", {}).get("value", {})
-        size = asset["file:size"]
-        return int(size)
+        size = self._asset_value.get("file:size")
+        return None if size is None else int(size)
 
-    @property
+    def get_result_checksum(self) -> Optional[str]:
+        checksum = self._asset_value.get("file:checksum")
+        return None if checksum is None else str(checksum)
+
+    @functools.cached_property
     def location(self) -> str:
         result_href = self.get_result_href()
         return urllib.parse.urljoin(self.response.url, result_href)
 
+    @functools.cached_property
+    def _default_target(self) -> str:
+        path = urllib.parse.urlparse(self.location).path
+        return path.rstrip("/").rpartition("/")[2]
+
+    def _download_ranges(self, url: str, target: str, timeout: int) -> bool:
+        # large results are fetched as parallel byte ranges, each on its own
+        # connection, when the server supports them
+        expected_size = self.get_result_size()
+        if expected_size is not None and expected_size <= RANGE_CHUNK_SIZE:
+            # not worth the round trip of the HEAD request
+            return False
+        head = self.session.head(url, allow_redirects=True, timeout=timeout)
+        size = int(head.headers.get("Content-Length", 0))
+        if (
+            head.status_code != 200
+            or head.headers.get("Accept-Ranges") != "bytes"
+            or size <= RANGE_CHUNK_SIZE
+        ):
+            return False
+
+        with open(target, "wb") as f:
+            f.truncate(size)
+
+        def download_range(start: int) -> None:
+            end = min(start + RANGE_CHUNK_SIZE, size) - 1
+            with self.session.get(
+                url,
+                headers={"Range": f"bytes={start}-{end}"},
+                stream=True,
+                timeout=timeout,
+            ) as response:
+                if response.status_code != 206:
+                    raise DownloadError(
+                        f"Range request not honoured: {response.status_code}"
+                    )
+                written = 0
+                with open(target, "r+b") as f:
+                    f.seek(start)
+                    for chunk in response.iter_content(chunk_size=1024 * 1024):
+                        written += f.write(chunk)
+            # the preallocated file hides short ranges from the size check
+            if written != end - start + 1:
+                raise DownloadError(
+                    f"Range bytes={start}-{end} returned {written} byte(s)"
+                )
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=RANGE_WORKERS
+        ) as executor:
+            list(executor.map(download_range, range(0, size, RANGE_CHUNK_SIZE)))
+        return True
+
     def download(
         self,
         target: Optional[str] = None,
         timeout: int = 60,
-        retry_options: Dict[str, Any] = {},
+        retry_options: Optional[Dict[str, Any]] = None,
+        ranges: bool = True,
     ) -> str:
         url = self.location
         if target is None:
-            parts = urllib.parse.urlparse(url)
-            target = parts.path.strip("/").split("/")[-1]
-
-        # FIXME add retry and progress bar
-        retry_options = retry_options.copy()
-        maximum_tries = retry_options.pop("maximum_tries", None)
-        if maximum_tries is not None:
-            retry_options["maximum_retries"] = maximum_tries
-        multiurl.download(
-            url, stream=True, target=target, timeout=timeout, **retry_options
-        )
-        target_size = os.path.getsize(target)
+            target = self._default_target
+
+        downloaded = False
+        if ranges:
+            try:
+                downloaded = self._download_ranges(url, target, timeout)
+            except (requests.RequestException, DownloadError) as exc:
+                logger.debug(f"ranged download failed, downloading in one go: {exc!r}")
+
+        if not downloaded:
+            # FIXME add retry and progress bar
+            retry_options = dict(retry_options or {})
+            maximum_tries = retry_options.pop("maximum_tries", None)
+            if maximum_tries is not None:
+                retry_options["maximum_retries"] = maximum_tries
+            multiurl.download(
+                url, stream=True, target=target, timeout=timeout, **retry_options
+            )
         size = self.get_result_size()
         if size:
+            target_size = os.path.getsize(target)
             if target_size != size:
                 raise DownloadError(
                     "Download failed: downloaded %s byte(s) out of %s"
@@ -371,6 +694,36 @@ class Results(ApiResponse):
         return target
 
 
+def download_many(
+    remotes: List[Remote],
+    target_dir: str,
+    workers: int = 8,
+    conns_per_host: int = 4,
+    retry_options: Optional[Dict[str, Any]] = None,
+) -> List[str]:
+    for session in {id(remote.session): remote.session for remote in remotes}.values():
+        resize_pool(session, workers)
+
+    semaphores: Dict[str, threading.BoundedSemaphore] = {}
+    lock = threading.Lock()
+
+    def download(remote: Remote) -> str:
+        remote.wait_on_result(retry_options=retry_options)
+        results = remote._robust_results(retry_options)
+        target = os.path.join(target_dir, results._default_target)
+        netloc = urllib.parse.urlparse(results.location).netloc
+        with lock:
+            semaphore = semaphores.setdefault(
+                netloc, threading.BoundedSemaphore(conns_per_host)
+            )
+        with semaphore:
+            # ranged downloads would open more connections than conns_per_host
+            return results.download(target, retry_options=retry_options, ranges=False)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(download, remotes))
+
+
 class Processing:
     supported_api_version = "v1"
 
@@ -378,36 +731,53 @@ class Processing:
         self,
         url: str,
         force_exact_url: bool = False,
-        headers: Dict[str, Any] = {},
-        session: requests.Session = requests.api,  # type: ignore
+        headers: Optional[Dict[str, Any]] = None,
+        session: Optional[requests.Session] = None,
         sleep_max: int = 120,
+        sleep_min: float = 0.05,
+        long_poll: bool = False,
     ) -> None:
         if not force_exact_url:
             url = f"{url}/{self.supported_api_version}"
         self.url = url
-        self.headers = headers
-        self.session = session
+        self.headers = {} if headers is None else headers
+        self.session = default_session() if session is None else session
         self.sleep_max = sleep_max
-
-    def processes(self, params: Dict[str, Any] = {}) -> ProcessList:
-        url = f"{self.url}/processes"
+        self.sleep_min = sleep_min
+        self.long_poll = long_poll
+        self.processes_url = f"{url}/processes"
+        self.jobs_url = f"{url}/jobs"
+        self._processes: Dict[str, Process] = {}
+
+    def processes(self, params: Optional[Dict[str, Any]] = None) -> ProcessList:
+        url = self.processes_url
         return ProcessList.from_request("get", url, params=params, session=self.session)
 
     def process(self, process_id: str) -> Process:
-        url = f"{self.url}/processes/{process_id}"
-        return Process.from_request(
-            "get", url, headers=self.headers, session=self.session
-        )
+        # process descriptions don't change during the life of a client
+        if (process := self._processes.get(process_id)) is None:
+            url = f"{self.processes_url}/{process_id}"
+            process = Process.from_request(
+                "get", url, headers=self.headers, session=self.session
+            )
+            self._processes[process_id] = process
+        return process
+
+    def invalidate(self, process_id: Optional[str] = None) -> None:
+        if process_id is None:
+            self._processes.clear()
+        else:
+            self._processes.pop(process_id, None)
 
     def process_execute(
         self,
         process_id: str,
         inputs: Dict[str, Any],
-        retry_options: Dict[str, Any] = {},
+        retry_options: Optional[Dict[str, Any]] = None,
         **kwargs: Any,
     ) -> StatusInfo:
         assert "json" not in kwargs
-        url = f"{self.url}/processes/{process_id}/execute"
+        url = f"{self.processes_url}/{process_id}/execute"
         headers = kwargs.pop("headers", {})
         return StatusInfo.from_request(
             "post",
@@ -415,24 +785,24 @@ class Processing:
             json={"inputs": inputs},
             headers={**self.headers, **headers},
             session=self.session,
-            retry_options=retry_options,
+            retry_options={} if retry_options is None else retry_options,
             **kwargs,
         )
 
-    def jobs(self, params: Dict[str, Any] = {}) -> JobList:
-        url = f"{self.url}/jobs"
+    def jobs(self, params: Optional[Dict[str, Any]] = None) -> JobList:
+        url = self.jobs_url
         return JobList.from_request(
             "get", url, params=params, headers=self.headers, session=self.session
         )
 
     def job(self, job_id: str) -> StatusInfo:
-        url = f"{self.url}/jobs/{job_id}"
+        url = f"{self.jobs_url}/{job_id}"
         return StatusInfo.from_request(
             "get", url, headers=self.headers, session=self.session
         )
 
     def job_results(self, job_id: str) -> Results:
-        url = f"{self.url}/jobs/{job_id}/results"
+        url = f"{self.jobs_url}/{job_id}/results"
         return Results.from_request(
             "get", url, headers=self.headers, session=self.session
         )
@@ -440,24 +810,39 @@ class Processing:
     # convenience methods
 
     def submit(
-        self, collection_id: str, retry_options: Dict[str, Any] = {}, **request: Any
+        self,
+        collection_id: str,
+        retry_options: Optional[Dict[str, Any]] = None,
+        **request: Any,
     ) -> Remote:
         status_info = self.process_execute(
             collection_id, request, retry_options=retry_options
         )
-        return status_info.make_remote(sleep_max=self.sleep_max)
+        return status_info.make_remote(
+            sleep_max=self.sleep_max,
+            sleep_min=self.sleep_min,
+            long_poll=self.long_poll,
+        )
 
     def submit_and_wait_on_result(
-        self, collection_id: str, retry_options: Dict[str, Any] = {}, **request: Any
+        self,
+        collection_id: str,
+        retry_options: Optional[Dict[str, Any]] = None,
+        **request: Any,
     ) -> Results:
         remote = self.submit(collection_id, retry_options=retry_options, **request)
         remote.wait_on_result(retry_options=retry_options)
         return remote.make_results()
 
     def make_remote(self, job_id: str) -> Remote:
-        url = f"{self.url}/jobs/{job_id}"
+        url = f"{self.jobs_url}/{job_id}"
         return Remote(
-            url, headers=self.headers, session=self.session, sleep_max=self.sleep_max
+            url,
+            headers=self.headers,
+            session=self.session,
+            sleep_max=self.sleep_max,
+            sleep_min=self.sleep_min,
+            long_poll=self.long_poll,
         )
 
     def download_result(
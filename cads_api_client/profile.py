@@ -1,4 +1,6 @@
-from typing import Any, Dict
+from typing import Any, Dict, Optional
+
+import requests
 
 from . import processing
 
@@ -6,23 +8,37 @@ from . import processing
 class Profile:
     supported_api_version = "v1"
 
-    def __init__(self, url: str, headers: Dict[str, Any] = {}) -> None:
+    def __init__(
+        self,
+        url: str,
+        headers: Optional[Dict[str, Any]] = None,
+        session: Optional[requests.Session] = None,
+    ) -> None:
         self.url = f"{url}/{self.supported_api_version}"
-        self.headers = headers
+        self.headers = {} if headers is None else headers
+        self.session = processing.default_session() if session is None else session
 
     def profile(self) -> Dict[str, Any]:
         url = f"{self.url}/account"
-        response = processing.ApiResponse.from_request("get", url, headers=self.headers)
+        response = processing.ApiResponse.from_request(
+            "get", url, headers=self.headers, session=self.session
+        )
         return response.json
 
     def accept_licence(self, licence_id: str, revision: int) -> Dict[str, Any]:
         url = f"{self.url}/account/licences/{licence_id}"
         response = processing.ApiResponse.from_request(
-            "put", url, headers=self.headers, json={"revision": revision}
+            "put",
+            url,
+            headers=self.headers,
+            json={"revision": revision},
+            session=self.session,
         )
         return response.json
 
     def accepted_licences(self) -> Dict[str, Any]:
         url = f"{self.url}/account/licences"
-        response = processing.ApiResponse.from_request("get", url, headers=self.headers)
+        response = processing.ApiResponse.from_request(
+            "get", url, headers=self.headers, session=self.session
+        )
         return response.json
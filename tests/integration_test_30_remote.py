@@ -1,8 +1,9 @@
+import asyncio
 import pathlib
 
 import pytest
 
-from cads_api_client import catalogue, processing
+from cads_api_client import async_processing, catalogue, processing
 
 
 def test_from_collection_to_process(api_root_url: str) -> None:
@@ -30,6 +31,19 @@ def test_collection_submit(api_root_url: str, api_anon_key: str) -> None:
     assert isinstance(res.status, str)
 
 
+def test_collection_wait_on_results_async(api_root_url: str, api_anon_key: str) -> None:
+    collection_id = "test-adaptor-dummy"
+    headers = {"PRIVATE-TOKEN": api_anon_key}
+
+    cat = catalogue.Catalogue(f"{api_root_url}/catalogue", headers=headers)
+    dataset = cat.collection(collection_id)
+    remotes = [dataset.submit() for _ in range(2)]
+
+    asyncio.run(async_processing.wait_on_results(remotes))
+
+    assert [remote.status for remote in remotes] == ["successful"] * 2
+
+
 def test_collection_retrieve_with_dummy_adaptor(
     api_root_url: str, api_anon_key: str, tmp_path: pathlib.Path
 ) -> None:
@@ -0,0 +1,115 @@
+import asyncio
+import json
+from typing import Any, Dict, List, Union
+
+import pytest
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from cads_api_client import async_processing, processing  # noqa: E402
+
+JOB_URL = (
+    "http://localhost:8080/api/retrieve/v1/jobs/9bfc1362-2832-48e1-a235-359267420bb2"
+)
+JOB_FAILING_URL = (
+    "http://localhost:8080/api/retrieve/v1/jobs/9bfc1362-2832-48e1-a235-359267420bb3"
+)
+
+Reply = Union[int, Dict[str, Any], Exception]
+
+
+class FakeResponse:
+    def __init__(self, reply: Reply) -> None:
+        self.reply = reply
+        self.status = reply if isinstance(reply, int) else 200
+        self.reason = "Service Unavailable" if self.status == 503 else "OK"
+
+    async def __aenter__(self) -> "FakeResponse":
+        if isinstance(self.reply, Exception):
+            raise self.reply
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    async def read(self) -> bytes:
+        return json.dumps(self.reply).encode()
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:
+            raise aiohttp.ClientResponseError(
+                request_info=None, history=(), status=self.status
+            )
+
+
+class FakeSession:
+    def __init__(self, replies: Dict[str, List[Reply]]) -> None:
+        self.replies = replies
+        self.calls: List[str] = []
+
+    async def __aenter__(self) -> "FakeSession":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        pass
+
+    def get(self, url: str, **kwargs: Any) -> FakeResponse:
+        self.calls.append(url)
+        return FakeResponse(self.replies[url].pop(0))
+
+
+def test_wait_on_result_retries() -> None:
+    session = FakeSession(
+        {
+            JOB_URL: [
+                503,
+                aiohttp.ServerDisconnectedError(),
+                {"status": "running"},
+                {"status": "successful"},
+            ]
+        }
+    )
+    remote = processing.Remote(JOB_URL, sleep_min=0.001)
+    async_remote = async_processing.AsyncRemote(remote, session)  # type: ignore[arg-type]
+
+    asyncio.run(async_remote.wait_on_result({"maximum_tries": 3, "retry_after": 0}))
+
+    assert session.calls == [JOB_URL] * 4
+    # the final status is shared with the synchronous remote
+    assert remote.status == "successful"
+
+    session = FakeSession({JOB_URL: [503, 503]})
+    remote = processing.Remote(JOB_URL)
+    async_remote = async_processing.AsyncRemote(remote, session)  # type: ignore[arg-type]
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(async_remote.wait_on_result({"maximum_tries": 2, "retry_after": 0}))
+    assert session.calls == [JOB_URL] * 2
+
+
+def test_wait_on_results(monkeypatch: pytest.MonkeyPatch) -> None:
+    session = FakeSession(
+        {
+            JOB_URL: [{"status": "running"}, {"status": "successful"}],
+            JOB_FAILING_URL: [500],
+        }
+    )
+    monkeypatch.setattr(
+        "cads_api_client.async_processing.aiohttp.ClientSession",
+        lambda **kwargs: session,
+    )
+    remotes = [
+        processing.Remote(JOB_FAILING_URL),
+        processing.Remote(JOB_URL, sleep_min=0.001),
+    ]
+
+    # the failing job doesn't stop the others from being waited on
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(
+            async_processing.wait_on_results(
+                remotes, retry_options={"maximum_tries": 1}
+            )
+        )
+
+    assert remotes[1].status == "successful"
+    assert session.calls.count(JOB_URL) == 2
@@ -1,9 +1,16 @@
+import concurrent.futures
 import json
 import logging
+import pathlib
+import threading
+import time
+import types
+from typing import Dict, Tuple
 
 import pytest
+import requests
 import responses
-from responses.matchers import json_params_matcher
+from responses.matchers import header_matcher, json_params_matcher
 
 import cads_api_client
 
@@ -384,6 +391,18 @@ def test_catalogue_collections() -> None:
 
     collection = catalogue.collection(COLLECTION_ID)
     assert collection.response.json() == COLLECTION_JSON
+    assert collection.get_links() == COLLECTION_JSON["links"]
+    assert collection.get_link_href(rel="retrieve") == PROCESS_URL
+
+    bulk = catalogue.collections_bulk([COLLECTION_ID, COLLECTION_ID])
+    assert [collection.id for collection in bulk] == [COLLECTION_ID] * 2
+
+    # lookups are memoized until invalidated
+    assert catalogue.collection(COLLECTION_ID) is collection
+    assert len(responses.calls) == 2
+    catalogue.invalidate(COLLECTION_ID)
+    assert catalogue.collection(COLLECTION_ID) is not collection
+    assert len(responses.calls) == 3
 
 
 @responses.activate
@@ -403,6 +422,56 @@ def test_submit() -> None:
     assert remote.url == JOB_SUCCESSFUL_URL
     assert remote.status == "successful"
 
+    # the process description is fetched once per collection
+    assert collection.retrieve_process() is process
+    process_urls = [call.request.url for call in responses.calls]
+    assert process_urls.count(PROCESS_URL) == 1
+
+
+@responses.activate
+def test_processing_process() -> None:
+    responses_add()
+
+    proc = cads_api_client.Processing("http://localhost:8080/api/retrieve")
+    process = proc.process(COLLECTION_ID)
+    assert process.id == COLLECTION_ID
+
+    # lookups are memoized until invalidated
+    assert proc.process(COLLECTION_ID) is process
+    assert len(responses.calls) == 1
+    proc.invalidate(COLLECTION_ID)
+    assert proc.process(COLLECTION_ID) is not process
+    assert len(responses.calls) == 2
+    proc.invalidate()
+    proc.process(COLLECTION_ID)
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_session_is_shared() -> None:
+    responses_add()
+
+    catalogue = cads_api_client.Catalogue(CATALOGUE_URL)
+    assert catalogue.session is cads_api_client.Processing(CATALOGUE_URL).session
+
+    collection = catalogue.collection(COLLECTION_ID)
+    process = collection.retrieve_process()
+    remote = collection.submit(variable="temperature", year="2022")
+    assert collection.session is catalogue.session
+    assert process.session is catalogue.session
+    assert remote.session is catalogue.session
+
+    session = requests.Session()
+    job = process.execute(
+        inputs={"variable": "temperature", "year": "2022"}, session=session
+    )
+    assert job.session is session
+
+    # clients don't share cookies and connection pools
+    client = cads_api_client.ApiClient(key="KEY", url=CATALOGUE_URL)
+    assert client.session is not catalogue.session
+    assert client.session is not cads_api_client.ApiClient().session
+
 
 @responses.activate
 def test_wait_on_result() -> None:
@@ -414,6 +483,57 @@ def test_wait_on_result() -> None:
     remote.wait_on_result()
 
 
+@responses.activate
+def test_wait_on_result_backoff(monkeypatch: pytest.MonkeyPatch) -> None:
+    for status in ["accepted"] * 3 + ["running"] * 3 + ["successful"]:
+        responses.add(
+            responses.GET,
+            url=JOB_RUNNING_URL,
+            json={**JOB_RUNNING_JSON, "status": status},
+            content_type="application/json",
+        )
+
+    sleeps: list[float] = []
+    jitter_bounds: list[tuple[float, float]] = []
+
+    def sleep(seconds: float) -> None:
+        sleeps.append(seconds)
+
+    def monotonic() -> float:
+        return sum(sleeps)
+
+    def uniform(a: float, b: float) -> float:
+        jitter_bounds.append((a, b))
+        return b
+
+    fake_time = types.SimpleNamespace(sleep=sleep, monotonic=monotonic)
+    monkeypatch.setattr(cads_api_client.processing, "time", fake_time)
+    monkeypatch.setattr("cads_api_client.processing.random.uniform", uniform)
+
+    remote = cads_api_client.processing.Remote(JOB_RUNNING_URL, sleep_max=1)
+    remote.wait_on_result()
+
+    # 1.5x growth, reset when the job starts running
+    expected = [0.05, 0.075, 0.1125, 0.05, 0.075, 0.1125]
+    assert sleeps == pytest.approx([sleep * 1.2 for sleep in expected])
+    assert set(jitter_bounds) == {(0.8, 1.2)}
+
+    remote = cads_api_client.processing.Remote(
+        JOB_RUNNING_URL, sleep_max=1, sleep_min=0.5
+    )
+    for status in ["accepted"] * 4 + ["successful"]:
+        responses.add(
+            responses.GET,
+            url=JOB_RUNNING_URL,
+            json={**JOB_RUNNING_JSON, "status": status},
+            content_type="application/json",
+        )
+    sleeps.clear()
+    remote.wait_on_result()
+    # capped at sleep_max
+    assert sleeps == pytest.approx([0.6, 0.9, 1.2, 1.2])
+
+
 @responses.activate
 def test_wait_on_result_failed() -> None:
     responses_add()
@@ -493,3 +613,408 @@ def test_remote_logs(caplog: pytest.LogCaptureFixture) -> None:
         ("cads_api_client.processing", 30, "This is a warning log"),
         ("cads_api_client.processing", 20, "status has been updated to successful"),
     ]
+
+
+@responses.activate
+def test_remote_status_cache() -> None:
+    responses_add()
+
+    catalogue = cads_api_client.Catalogue(CATALOGUE_URL)
+    collection = catalogue.collection(COLLECTION_ID)
+    remote = collection.submit(variable="temperature", year="2022")
+    remote.wait_on_result()
+    assert remote.status == "successful"
+
+    status_calls = [
+        call for call in responses.calls if str(call.request.url).startswith(remote.url)
+    ]
+    assert len(status_calls) == 1
+
+
+@responses.activate
+def test_download_many(tmp_path: pathlib.Path) -> None:
+    # resizing the pool must not leak into the other tests
+    session = cads_api_client.processing.make_session()
+    remotes = []
+    for index in range(2):
+        job_url = f"http://localhost:8080/api/retrieve/v1/jobs/job-{index}"
+        results_url = f"{job_url}/results"
+        asset_url = f"{job_url}/result-{index}.txt"
+        responses.add(
+            responses.GET,
+            url=job_url,
+            json={
+                "status": "successful",
+                "links": [{"href": results_url, "rel": "results"}],
+            },
+            content_type="application/json",
+        )
+        responses.add(
+            responses.GET,
+            url=results_url,
+            json={
+                "asset": {"value": {"href": f"./result-{index}.txt", "file:size": 8}}
+            },
+            content_type="application/json",
+        )
+        responses.add(responses.HEAD, url=asset_url, headers={"Content-Length": "8"})
+        responses.add(responses.GET, url=asset_url, body=f"result-{index}")
+        remotes.append(cads_api_client.processing.Remote(job_url, session=session))
+
+    res = cads_api_client.processing.download_many(remotes, str(tmp_path), workers=12)
+
+    assert res == [str(tmp_path / f"result-{index}.txt") for index in range(2)]
+    for index, target in enumerate(res):
+        assert pathlib.Path(target).read_text() == f"result-{index}"
+
+    # final status and results are reused by a second download
+    res = cads_api_client.processing.download_many(remotes, str(tmp_path), workers=12)
+
+    # status links are reused, each job is polled only once
+    urls = [str(call.request.url).partition("?")[0] for call in responses.calls]
+    status_urls = [url for url in urls if url in {remote.url for remote in remotes}]
+    assert sorted(status_urls) == [remote.url for remote in remotes]
+    results_urls = [url for url in urls if url.endswith("/results")]
+    assert sorted(results_urls) == [f"{remote.url}/results" for remote in remotes]
+
+    adapter = session.get_adapter("https://")
+    assert isinstance(adapter, requests.adapters.HTTPAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 12
+
+
+@responses.activate
+def test_results_asset() -> None:
+    responses.add(
+        responses.GET,
+        url=RESULT_SUCCESSFUL_URL,
+        json=RESULT_SUCCESSFUL_JSON,
+        content_type="application/json",
+    )
+
+    results = cads_api_client.Results.from_request("get", RESULT_SUCCESSFUL_URL)
+
+    asset = RESULT_SUCCESSFUL_JSON["asset"]["value"]
+    assert results.get_result_href() == asset["href"]
+    assert results.get_result_size() == asset["file:size"]
+    assert results.get_result_checksum() == asset["file:checksum"]
+    assert results.location == f"{JOB_SUCCESSFUL_URL}/{asset['file:checksum']}"
+
+
+@responses.activate
+def test_results_download_without_size(tmp_path: pathlib.Path) -> None:
+    asset_url = f"{JOB_SUCCESSFUL_URL}/result.txt"
+    responses.add(
+        responses.GET,
+        url=RESULT_SUCCESSFUL_URL,
+        json={"asset": {"value": {"href": "./result.txt"}}},
+        content_type="application/json",
+    )
+    responses.add(responses.HEAD, url=asset_url, headers={"Content-Length": "6"})
+    responses.add(responses.GET, url=asset_url, body="result")
+
+    results = cads_api_client.Results.from_request("get", RESULT_SUCCESSFUL_URL)
+    assert results.get_result_size() is None
+
+    # without a reported size the download isn't checked
+    target = results.download(str(tmp_path / "result.txt"))
+    assert pathlib.Path(target).read_text() == "result"
+
+
+@responses.activate
+def test_remote_status_not_modified() -> None:
+    responses.add(
+        responses.GET,
+        url=JOB_RUNNING_URL,
+        json=JOB_RUNNING_JSON,
+        headers={"ETag": '"v1"'},
+        content_type="application/json",
+    )
+    responses.add(
+        responses.GET,
+        url=JOB_RUNNING_URL,
+        status=304,
+        match=[header_matcher({"If-None-Match": '"v1"'})],
+    )
+
+    remote = cads_api_client.processing.Remote(JOB_RUNNING_URL)
+    remote.status_ttl = 0
+
+    assert remote.status == "running"
+    assert remote.status == "running"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_session_retries() -> None:
+    responses.add(responses.GET, url=PROCESS_URL, status=503)
+    responses.add(
+        responses.GET,
+        url=PROCESS_URL,
+        json=PROCESS_JSON,
+        content_type="application/json",
+    )
+
+    proc = cads_api_client.Processing(
+        "http://localhost:8080/api/retrieve",
+        session=cads_api_client.processing.make_session(),
+    )
+    process = proc.process(COLLECTION_ID)
+
+    assert process.id == COLLECTION_ID
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_session_retries_not_multiplied(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    responses.add(responses.GET, url=PROCESS_URL, status=503)
+
+    # the adapter retries, multiurl doesn't retry on top of it
+    with pytest.raises(requests.HTTPError):
+        cads_api_client.processing.ApiResponse.from_request(
+            "get",
+            PROCESS_URL,
+            session=cads_api_client.processing.make_session(),
+            retry_options={"maximum_tries": 3, "retry_after": 0},
+        )
+    assert len(responses.calls) == 6
+
+
+@responses.activate
+def test_plain_session_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr("time.sleep", lambda seconds: None)
+    responses.add(responses.GET, url=COLLECTION_URL, status=503)
+    responses.add(
+        responses.GET,
+        url=COLLECTION_URL,
+        json=COLLECTION_JSON,
+        content_type="application/json",
+    )
+
+    # sessions without retries in their adapters fall back to multiurl
+    catalogue = cads_api_client.Catalogue(CATALOGUE_URL, session=requests.Session())
+    collection = catalogue.collection(COLLECTION_ID)
+
+    assert collection.id == COLLECTION_ID
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_coalesce_concurrent_gets() -> None:
+    event = threading.Event()
+
+    def callback(request: requests.PreparedRequest) -> Tuple[int, Dict[str, str], str]:
+        event.wait(timeout=5)
+        return (200, {}, json.dumps(PROCESS_JSON))
+
+    responses.add_callback(responses.GET, url=PROCESS_URL, callback=callback)
+
+    def get(_: int) -> cads_api_client.processing.ApiResponse:
+        return cads_api_client.processing.ApiResponse.from_request("get", PROCESS_URL)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(get, i) for i in range(4)]
+        time.sleep(0.1)
+        event.set()
+        res = [future.result() for future in futures]
+
+    assert [response.json for response in res] == [PROCESS_JSON] * 4
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_wait_on_result_long_poll() -> None:
+    events = [
+        {**JOB_RUNNING_JSON, "status": "running"},
+        {**JOB_RUNNING_JSON, "status": "successful"},
+    ]
+    responses.add(
+        responses.GET,
+        url=f"{JOB_RUNNING_URL}/watch",
+        body="".join(
+            f"event: status\ndata: {json.dumps(event)}\n\n" for event in events
+        ),
+        content_type="text/event-stream",
+    )
+
+    remote = cads_api_client.processing.Remote(JOB_RUNNING_URL, long_poll=True)
+    remote.wait_on_result()
+
+    assert remote.status == "successful"
+    assert len(responses.calls) == 1
+
+    # fall back to polling when the server doesn't support long polling
+    responses.add(responses.GET, url=f"{JOB_SUCCESSFUL_URL}/watch", status=404)
+    responses.add(
+        responses.GET,
+        url=JOB_SUCCESSFUL_URL,
+        json=JOB_SUCCESSFUL_JSON,
+        content_type="application/json",
+    )
+
+    remote = cads_api_client.processing.Remote(JOB_SUCCESSFUL_URL, long_poll=True)
+    remote.wait_on_result()
+
+    assert remote.long_poll is False
+    assert len(responses.calls) == 3
+
+
+@responses.activate
+def test_wait_on_result_long_poll_events() -> None:
+    # multi-line data fields are joined before parsing
+    running = json.dumps({**JOB_RUNNING_JSON, "status": "running"}, indent=1)
+    successful = json.dumps({**JOB_RUNNING_JSON, "status": "successful"}, indent=1)
+    responses.add(
+        responses.GET,
+        url=f"{JOB_RUNNING_URL}/watch",
+        body="".join(
+            "event: status\n"
+            + "".join(f"data: {line}\n" for line in event.splitlines())
+            + "\n"
+            for event in (running, successful)
+        ),
+        content_type="text/event-stream",
+    )
+
+    remote = cads_api_client.processing.Remote(JOB_RUNNING_URL, long_poll=True)
+    remote.wait_on_result()
+
+    assert remote.status == "successful"
+    assert len(responses.calls) == 1
+
+
+@pytest.mark.parametrize("data", ["{not json", json.dumps({"no": "status"})])
+@responses.activate
+def test_wait_on_result_long_poll_malformed(data: str) -> None:
+    responses.add(
+        responses.GET,
+        url=f"{JOB_SUCCESSFUL_URL}/watch",
+        body=f"event: status\ndata: {data}\n\n",
+        content_type="text/event-stream",
+    )
+    responses.add(
+        responses.GET,
+        url=JOB_SUCCESSFUL_URL,
+        json=JOB_SUCCESSFUL_JSON,
+        content_type="application/json",
+    )
+
+    # malformed events switch back to polling
+    remote = cads_api_client.processing.Remote(JOB_SUCCESSFUL_URL, long_poll=True)
+    remote.wait_on_result()
+
+    assert remote.long_poll is False
+    assert remote.status == "successful"
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_results_download_ranges(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    content = b"01234567"
+    asset_url = (
+        f"{JOB_SUCCESSFUL_URL}/e7d452a747061ab880887d88814bfb0c27593a73cb7736d2dc340852"
+    )
+
+    def callback(
+        request: requests.PreparedRequest,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        if "Range" not in request.headers:
+            return (200, {}, content)
+        start, end = map(int, request.headers["Range"][len("bytes=") :].split("-"))
+        return (206, {}, content[start : end + 1])
+
+    responses.add(
+        responses.GET,
+        url=RESULT_SUCCESSFUL_URL,
+        json=RESULT_SUCCESSFUL_JSON,
+        content_type="application/json",
+    )
+    responses.add(
+        responses.HEAD,
+        url=asset_url,
+        headers={"Accept-Ranges": "bytes", "Content-Length": str(len(content))},
+    )
+    responses.add_callback(responses.GET, url=asset_url, callback=callback)
+    monkeypatch.setattr(cads_api_client.processing, "RANGE_CHUNK_SIZE", 3)
+
+    results = cads_api_client.Results.from_request("get", RESULT_SUCCESSFUL_URL)
+    target = results.download(str(tmp_path / "result.nc"))
+
+    assert pathlib.Path(target).read_bytes() == content
+    ranges = [
+        call.request.headers.get("Range", "")
+        for call in responses.calls
+        if call.request.method == "GET" and call.request.url == asset_url
+    ]
+    assert sorted(ranges) == ["bytes=0-2", "bytes=3-5", "bytes=6-7"]
+
+    target = results.download(str(tmp_path / "single.nc"), ranges=False)
+    assert pathlib.Path(target).read_bytes() == content
+    range_calls = [call for call in responses.calls if "Range" in call.request.headers]
+    assert len(range_calls) == 3
+
+
+@responses.activate
+def test_results_download_short_ranges(
+    tmp_path: pathlib.Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    content = b"01234567"
+    asset_url = (
+        f"{JOB_SUCCESSFUL_URL}/e7d452a747061ab880887d88814bfb0c27593a73cb7736d2dc340852"
+    )
+
+    def callback(
+        request: requests.PreparedRequest,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        if "Range" not in request.headers:
+            return (200, {}, content)
+        start = int(request.headers["Range"][len("bytes=") :].partition("-")[0])
+        return (206, {}, content[start : start + 1])
+
+    responses.add(
+        responses.GET,
+        url=RESULT_SUCCESSFUL_URL,
+        json=RESULT_SUCCESSFUL_JSON,
+        content_type="application/json",
+    )
+    responses.add(
+        responses.HEAD,
+        url=asset_url,
+        headers={"Accept-Ranges": "bytes", "Content-Length": str(len(content))},
+    )
+    responses.add_callback(responses.GET, url=asset_url, callback=callback)
+    monkeypatch.setattr(cads_api_client.processing, "RANGE_CHUNK_SIZE", 3)
+
+    # short ranges fall back to a single download
+    results = cads_api_client.Results.from_request("get", RESULT_SUCCESSFUL_URL)
+    target = results.download(str(tmp_path / "result.nc"))
+
+    assert pathlib.Path(target).read_bytes() == content
+
+
+@responses.activate
+def test_results_download_small(tmp_path: pathlib.Path) -> None:
+    asset_url = (
+        f"{JOB_SUCCESSFUL_URL}/e7d452a747061ab880887d88814bfb0c27593a73cb7736d2dc340852"
+    )
+    responses.add(
+        responses.GET,
+        url=RESULT_SUCCESSFUL_URL,
+        json=RESULT_SUCCESSFUL_JSON,
+        content_type="application/json",
+    )
+    responses.add(
+        responses.HEAD,
+        url=asset_url,
+        headers={"Accept-Ranges": "bytes", "Content-Length": "8"},
+    )
+    responses.add(responses.GET, url=asset_url, body=b"01234567")
+
+    results = cads_api_client.Results.from_request("get", RESULT_SUCCESSFUL_URL)
+    results.download(str(tmp_path / "result.nc"))
+
+    # small results don't pay for the extra HEAD of the ranged download
+    methods = [call.request.method for call in responses.calls]
+    assert methods.count("HEAD") == 1